@@ -1,6 +1,7 @@
 # Misbah added
 import asyncio  # Misbah added
 import glob  # Misbah added
+import gzip  # Misbah added
 import os  # Misbah added
 import sys  # Misbah added
 import time  # Misbah added
@@ -8,11 +9,15 @@ from datetime import datetime, timezone  # Misbah added
 from typing import Literal, Optional  # Misbah added
 from uuid import uuid4  # Misbah added
 import sys
+import numpy as np  # Misbah added
 import pyfirmata  # Misbah added
-from fastapi import FastAPI, HTTPException  # Misbah added
+from fastapi import FastAPI, Header, HTTPException, Query, Request  # Misbah added
 from fastapi.middleware.cors import CORSMiddleware  # Misbah added
+from fastapi.responses import Response  # Misbah added
 from pydantic import BaseModel, Field  # Misbah added
 
+from posture_math import MIN_FACE_LANDMARKS, MIN_POSE_LANDMARKS, score_face_frames, score_pose_frames  # Misbah added
+
 
 # Misbah added
 class RsiPayload(BaseModel):  # Misbah added
@@ -55,6 +60,20 @@ class RsiResponse(BaseModel):  # Misbah added
   detections: list[RsiDetection]  # Misbah added
 
 
+# Misbah added
+class PostureBatch(BaseModel):  # Misbah added
+  pose: Optional[list[list[list[float]]]] = Field(None, description="MediaPipe pose landmark frames (frames x landmarks x 2), normalized x/y")  # Misbah added
+  face: Optional[list[list[list[float]]]] = Field(None, description="MediaPipe face mesh landmark frames (frames x landmarks x 2), normalized x/y")  # Misbah added
+  width: float = Field(1.0, gt=0, description="Video width the frontend scales x by before measuring")  # Misbah added
+  height: float = Field(1.0, gt=0, description="Video height the frontend scales y by before measuring")  # Misbah added
+
+
+# Misbah added
+class PostureScores(BaseModel):  # Misbah added
+  pose: Optional[dict[str, list[float]]] = None  # Misbah added
+  face: Optional[dict[str, list[float]]] = None  # Misbah added
+
+
 # Misbah added
 app = FastAPI(title="BioAmp Wrist API", description="Receives on-device RSI telemetry and exposes session analytics.", version="0.1.0")  # Misbah added
 
@@ -76,6 +95,11 @@ MAX_TRACKED_SESSIONS = 200  # Misbah added
 MAX_TRACKED_DETECTIONS = 400  # Misbah added
 _sessions: list[RsiSession] = []  # Misbah added
 _detections: list[RsiDetection] = []  # Misbah added
+# Bumped on every write; the serialized /rsi body is rebuilt lazily when it falls behind.  # Misbah added
+_state_version = 0  # Misbah added
+_cached_version = -1  # Misbah added
+_cached_body = b""  # Misbah added
+_cached_gzip: Optional[bytes] = None  # Misbah added
 
 
 # Misbah added
@@ -94,6 +118,59 @@ def _summary() -> RsiSummary:  # Misbah added
   )  # Misbah added
 
 
+# Misbah added
+def _mark_dirty() -> None:  # Misbah added
+  global _state_version  # Misbah added
+  _state_version += 1  # Misbah added
+
+
+# Misbah added
+def _serialized_rsi(accept_gzip: bool) -> bytes:  # Misbah added
+  global _cached_version, _cached_body, _cached_gzip  # Misbah added
+  if _cached_version != _state_version:  # Misbah added
+    snapshot = RsiResponse(summary=_summary(), sessions=list(_sessions), detections=list(_detections))  # Misbah added
+    _cached_body = snapshot.model_dump_json().encode("utf-8")  # Misbah added
+    _cached_gzip = None  # Misbah added
+    _cached_version = _state_version  # Misbah added
+  if not accept_gzip:  # Misbah added
+    return _cached_body  # Misbah added
+  if _cached_gzip is None:  # Misbah added
+    _cached_gzip = gzip.compress(_cached_body, compresslevel=6)  # Misbah added
+  return _cached_gzip  # Misbah added
+
+
+# Misbah added
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:  # Misbah added
+  # Honour q-values: "gzip;q=0" refuses gzip, and "*" only applies when gzip is not listed explicitly  # Misbah added
+  weights: dict[str, float] = {}  # Misbah added
+  for part in (accept_encoding or "").split(","):  # Misbah added
+    coding, *params = [token.strip() for token in part.split(";")]  # Misbah added
+    if not coding:  # Misbah added
+      continue  # Misbah added
+    q = 1.0  # Misbah added
+    for param in params:  # Misbah added
+      name, _, value = param.partition("=")  # Misbah added
+      if name.strip().lower() == "q":  # Misbah added
+        try:  # Misbah added
+          q = float(value)  # Misbah added
+        except ValueError:  # Misbah added
+          q = 0.0  # Misbah added
+    weights[coding.lower()] = q  # Misbah added
+  for coding in ("gzip", "x-gzip", "*"):  # Misbah added
+    if coding in weights:  # Misbah added
+      return weights[coding] > 0  # Misbah added
+  return False  # Misbah added
+
+
+# Misbah added
+def _rsi_response(accept_encoding: Optional[str]) -> Response:  # Misbah added
+  use_gzip = _accepts_gzip(accept_encoding)  # Misbah added
+  headers = {"Vary": "Accept-Encoding"}  # Misbah added
+  if use_gzip:  # Misbah added
+    headers["Content-Encoding"] = "gzip"  # Misbah added
+  return Response(content=_serialized_rsi(use_gzip), media_type="application/json", headers=headers)  # Misbah added
+
+
 # Misbah added
 def _append_session(duration: float, cumulative_risk: float, mean_envelope: Optional[float]) -> RsiSession:  # Misbah added
   session = RsiSession(  # Misbah added
@@ -104,6 +181,7 @@ def _append_session(duration: float, cumulative_risk: float, mean_envelope: Opti
     meanEnvelope=mean_envelope,  # Misbah added
   )  # Misbah added
   _sessions.append(session)  # Misbah added
+  _mark_dirty()  # Misbah added
   if len(_sessions) > MAX_TRACKED_SESSIONS:  # Misbah added
     del _sessions[0 : len(_sessions) - MAX_TRACKED_SESSIONS]  # Misbah added
   return session  # Misbah added
@@ -118,20 +196,44 @@ def _append_detection(timecode: Optional[float], mean_envelope: Optional[float])
     meanEnvelope=mean_envelope,  # Misbah added
   )  # Misbah added
   _detections.append(detection)  # Misbah added
+  _mark_dirty()  # Misbah added
   if len(_detections) > MAX_TRACKED_DETECTIONS:  # Misbah added
     del _detections[0 : len(_detections) - MAX_TRACKED_DETECTIONS]  # Misbah added
   return detection  # Misbah added
 
 
+# Misbah added
+POSTURE_SCORERS = {  # Misbah added
+  "pose": (score_pose_frames, MIN_POSE_LANDMARKS),  # Misbah added
+  "face": (score_face_frames, MIN_FACE_LANDMARKS),  # Misbah added
+}  # Misbah added
+
+
+# Misbah added
+def _score_landmarks(kind: str, frames: np.ndarray, width: float, height: float) -> dict[str, list[float]]:  # Misbah added
+  scorer, min_landmarks = POSTURE_SCORERS[kind]  # Misbah added
+  if frames.ndim != 3 or frames.shape[2] < 2 or frames.shape[1] < min_landmarks:  # Misbah added
+    raise HTTPException(status_code=400, detail=f"{kind} must be shaped frames x landmarks(>={min_landmarks}) x 2, got {frames.shape}")  # Misbah added
+  return {metric: values.tolist() for metric, values in scorer(frames, width, height).items()}  # Misbah added
+
+
+# Misbah added
+def _landmark_array(frames: list[list[list[float]]], kind: str) -> np.ndarray:  # Misbah added
+  try:  # Misbah added
+    return np.asarray(frames, dtype=np.float64)  # Misbah added
+  except ValueError:  # Misbah added
+    raise HTTPException(status_code=400, detail=f"{kind} frames must all have the same number of landmarks")  # Misbah added
+
+
 # Misbah added
 @app.get("/rsi", response_model=RsiResponse)  # Misbah added
-async def get_rsi() -> RsiResponse:  # Misbah added
-  return RsiResponse(summary=_summary(), sessions=list(_sessions), detections=list(_detections))  # Misbah added
+async def get_rsi(accept_encoding: Optional[str] = Header(None)) -> Response:  # Misbah added
+  return _rsi_response(accept_encoding)  # Misbah added
 
 
 # Misbah added
 @app.post("/rsi", response_model=RsiResponse)  # Misbah added
-async def post_rsi(payload: RsiPayload) -> RsiResponse:  # Misbah added
+async def post_rsi(payload: RsiPayload, accept_encoding: Optional[str] = Header(None)) -> Response:  # Misbah added
   if payload.event_type == "detection":  # Misbah added
     _append_detection(payload.time, payload.mean_envelope)  # Misbah added
   elif payload.event_type == "rsi_interval":  # Misbah added
@@ -142,4 +244,36 @@ async def post_rsi(payload: RsiPayload) -> RsiResponse:  # Misbah added
   else:  # Misbah added
     raise HTTPException(status_code=400, detail="Unsupported event_type")  # Misbah added
 
-  return await get_rsi()  # Misbah added
+  return _rsi_response(accept_encoding)  # Misbah added
+
+
+# Misbah added
+@app.post("/posture/score", response_model=PostureScores)  # Misbah added
+async def post_posture_score(batch: PostureBatch) -> PostureScores:  # Misbah added
+  if batch.pose is None and batch.face is None:  # Misbah added
+    raise HTTPException(status_code=400, detail="Provide pose and/or face landmark frames")  # Misbah added
+  scores = PostureScores()  # Misbah added
+  if batch.pose is not None:  # Misbah added
+    scores.pose = _score_landmarks("pose", _landmark_array(batch.pose, "pose"), batch.width, batch.height)  # Misbah added
+  if batch.face is not None:  # Misbah added
+    scores.face = _score_landmarks("face", _landmark_array(batch.face, "face"), batch.width, batch.height)  # Misbah added
+  return scores  # Misbah added
+
+
+# Misbah added
+# Dense variant for bulk re-scoring: the body is little-endian float32 x/y pairs (frames x landmarks x 2),  # Misbah added
+# which skips JSON decoding of every coordinate.  # Misbah added
+@app.post("/posture/score/raw", response_model=PostureScores)  # Misbah added
+async def post_posture_score_raw(  # Misbah added
+  request: Request,  # Misbah added
+  kind: Literal["pose", "face"] = Query(..., description="Which landmark model the frames come from"),  # Misbah added
+  landmarks: int = Query(..., gt=0, description="Landmarks per frame"),  # Misbah added
+  width: float = Query(1.0, gt=0),  # Misbah added
+  height: float = Query(1.0, gt=0),  # Misbah added
+) -> PostureScores:  # Misbah added
+  body = await request.body()  # Misbah added
+  frame_bytes = landmarks * 2 * 4  # Misbah added
+  if not body or len(body) % frame_bytes:  # Misbah added
+    raise HTTPException(status_code=400, detail=f"Body must be a whole number of {frame_bytes}-byte float32 frames")  # Misbah added
+  frames = np.frombuffer(body, dtype="<f4").reshape(-1, landmarks, 2)  # Misbah added
+  return PostureScores(**{kind: _score_landmarks(kind, frames, width, height)})  # Misbah added
@@ -0,0 +1,128 @@
+# Misbah added
+# Vectorized NumPy port of frontend/src/utils/postureMath.ts for re-scoring stored landmark streams.  # Misbah added
+# Every helper takes stacked points shaped (..., 2) (x, y) and returns one value per leading index,  # Misbah added
+# using the TypeScript operation order in float64; results agree with the browser to the last few ulps  # Misbah added
+# (libm vs V8 acos/atan/hypot rounding, ~1e-11 degrees at most).  # Misbah added
+import numpy as np  # Misbah added
+
+
+# Misbah added
+POSE_LANDMARKS = {  # Misbah added
+  "NOSE": 0,  # Misbah added
+  "LEFT_EYE_INNER": 1,  # Misbah added
+  "LEFT_EYE": 2,  # Misbah added
+  "LEFT_EYE_OUTER": 3,  # Misbah added
+  "RIGHT_EYE_INNER": 4,  # Misbah added
+  "RIGHT_EYE": 5,  # Misbah added
+  "RIGHT_EYE_OUTER": 6,  # Misbah added
+  "LEFT_EAR": 7,  # Misbah added
+  "RIGHT_EAR": 8,  # Misbah added
+  "MOUTH_LEFT": 9,  # Misbah added
+  "MOUTH_RIGHT": 10,  # Misbah added
+  "LEFT_SHOULDER": 11,  # Misbah added
+  "RIGHT_SHOULDER": 12,  # Misbah added
+  "LEFT_ELBOW": 13,  # Misbah added
+  "RIGHT_ELBOW": 14,  # Misbah added
+  "LEFT_WRIST": 15,  # Misbah added
+  "RIGHT_WRIST": 16,  # Misbah added
+  "LEFT_HIP": 23,  # Misbah added
+  "RIGHT_HIP": 24,  # Misbah added
+}  # Misbah added
+
+
+# Misbah added
+FACE_EYE_INDICES = {  # Misbah added
+  "LEFT": (33, 160, 158, 133, 153, 144),  # Misbah added
+  "RIGHT": (362, 385, 387, 263, 373, 380),  # Misbah added
+}  # Misbah added
+
+
+# Smallest landmark counts the batch scorers can index into  # Misbah added
+MIN_POSE_LANDMARKS = max(POSE_LANDMARKS["LEFT_SHOULDER"], POSE_LANDMARKS["RIGHT_SHOULDER"], POSE_LANDMARKS["RIGHT_EAR"]) + 1  # Misbah added
+MIN_FACE_LANDMARKS = max(FACE_EYE_INDICES["LEFT"] + FACE_EYE_INDICES["RIGHT"]) + 1  # Misbah added
+
+
+# Misbah added
+def euclidean(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:  # Misbah added
+  return np.hypot(p1[..., 0] - p2[..., 0], p1[..., 1] - p2[..., 1])  # Misbah added
+
+
+# Misbah added
+def calculate_angle(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:  # Misbah added
+  ba_x, ba_y = a[..., 0] - b[..., 0], a[..., 1] - b[..., 1]  # Misbah added
+  bc_x, bc_y = c[..., 0] - b[..., 0], c[..., 1] - b[..., 1]  # Misbah added
+  dot = ba_x * bc_x + ba_y * bc_y  # Misbah added
+  mag = np.hypot(ba_x, ba_y) * np.hypot(bc_x, bc_y)  # Misbah added
+  degenerate = mag == 0  # Misbah added
+  with np.errstate(divide="ignore", invalid="ignore"):  # Misbah added
+    cosine = np.clip(dot / np.where(degenerate, 1.0, mag), -1, 1)  # Misbah added
+  return np.where(degenerate, 0.0, (np.arccos(cosine) * 180) / np.pi)  # Misbah added
+
+
+# Misbah added
+def calculate_ear(points: np.ndarray) -> np.ndarray:  # Misbah added
+  # points: (..., 6, 2); 0 where the eye has no width, like calculateEAR  # Misbah added
+  if points.shape[-2] != 6:  # Misbah added
+    return np.zeros(points.shape[:-2])  # Misbah added
+  vertical1 = euclidean(points[..., 1, :], points[..., 5, :])  # Misbah added
+  vertical2 = euclidean(points[..., 2, :], points[..., 4, :])  # Misbah added
+  horizontal = euclidean(points[..., 0, :], points[..., 3, :])  # Misbah added
+  with np.errstate(divide="ignore", invalid="ignore"):  # Misbah added
+    ear = (vertical1 + vertical2) / (2.0 * horizontal)  # Misbah added
+  return np.where(horizontal == 0, 0.0, ear)  # Misbah added
+
+
+# Misbah added
+def degrees_from_slope(delta_y: np.ndarray, delta_x: np.ndarray) -> np.ndarray:  # Misbah added
+  return (np.arctan2(delta_y, delta_x) * 180) / np.pi  # Misbah added
+
+
+# Misbah added
+def _as_pixels(frames: np.ndarray, width: float, height: float) -> np.ndarray:  # Misbah added
+  # MediaPipe landmarks are normalized; the frontend scales them to the video size before measuring  # Misbah added
+  return np.asarray(frames, dtype=np.float64)[..., :2] * np.array([width, height], dtype=np.float64)  # Misbah added
+
+
+# Misbah added
+def score_pose_frames(frames: np.ndarray, width: float = 1.0, height: float = 1.0) -> dict[str, np.ndarray]:  # Misbah added
+  # frames: (frames, landmarks, 2) pose landmarks; mirrors the per-frame math in usePostureVision.ts  # Misbah added
+  points = _as_pixels(frames, width, height)  # Misbah added
+  left_shoulder = points[:, POSE_LANDMARKS["LEFT_SHOULDER"]]  # Misbah added
+  right_shoulder = points[:, POSE_LANDMARKS["RIGHT_SHOULDER"]]  # Misbah added
+  left_ear = points[:, POSE_LANDMARKS["LEFT_EAR"]]  # Misbah added
+  right_ear = points[:, POSE_LANDMARKS["RIGHT_EAR"]]  # Misbah added
+  left_eye = points[:, POSE_LANDMARKS["LEFT_EYE"]]  # Misbah added
+  right_eye = points[:, POSE_LANDMARKS["RIGHT_EYE"]]  # Misbah added
+
+  # Reference points straight above each shoulder (y = 0)  # Misbah added
+  zeros = np.zeros(len(points))  # Misbah added
+  above_right = np.stack((right_shoulder[:, 0], zeros), axis=-1)  # Misbah added
+  above_left = np.stack((left_shoulder[:, 0], zeros), axis=-1)  # Misbah added
+  shoulder_angle = calculate_angle(left_shoulder, right_shoulder, above_right)  # Misbah added
+  neck_angle_left = calculate_angle(left_ear, left_shoulder, above_left)  # Misbah added
+  neck_angle_right = calculate_angle(right_ear, right_shoulder, above_right)  # Misbah added
+
+  shoulder_tilt = np.arctan((right_shoulder[:, 1] - left_shoulder[:, 1]) / (right_shoulder[:, 0] - left_shoulder[:, 0] + 0.000001)) * (180 / np.pi)  # Misbah added
+  head_roll = np.arctan((right_eye[:, 1] - left_eye[:, 1]) / (right_eye[:, 0] - left_eye[:, 0] + 0.000001)) * (180 / np.pi)  # Misbah added
+  ear_midpoint_y = (left_ear[:, 1] + right_ear[:, 1]) / 2  # Misbah added
+  shoulder_midpoint_y = (left_shoulder[:, 1] + right_shoulder[:, 1]) / 2  # Misbah added
+
+  return {  # Misbah added
+    "shoulderAngle": shoulder_angle,  # Misbah added
+    "neckAngleLeft": neck_angle_left,  # Misbah added
+    "neckAngleRight": neck_angle_right,  # Misbah added
+    "neckAngle": (neck_angle_left + neck_angle_right) / 2,  # Misbah added
+    "shoulderTilt": shoulder_tilt,  # Misbah added
+    "headRoll": head_roll,  # Misbah added
+    "neckHeight": np.abs(ear_midpoint_y - shoulder_midpoint_y),  # Misbah added
+  }  # Misbah added
+
+
+# Misbah added
+def score_face_frames(frames: np.ndarray, width: float = 1.0, height: float = 1.0) -> dict[str, np.ndarray]:  # Misbah added
+  # frames: (frames, landmarks, 2) face landmarks  # Misbah added
+  # Gather the 12 eye landmarks before casting/scaling instead of converting the whole 478-point mesh  # Misbah added
+  eyes = _as_pixels(np.asarray(frames)[:, FACE_EYE_INDICES["LEFT"] + FACE_EYE_INDICES["RIGHT"]], width, height)  # Misbah added
+  left_ratio = calculate_ear(eyes[:, :6])  # Misbah added
+  right_ratio = calculate_ear(eyes[:, 6:])  # Misbah added
+  return {"leftEAR": left_ratio, "rightEAR": right_ratio, "ear": (left_ratio + right_ratio) / 2}  # Misbah added
@@ -0,0 +1,19 @@
+"""Importable EMG signal processing for the wrist strain monitor.
+
+Importing this package has no side effects: nothing talks to the board and
+scipy/matplotlib/pyfirmata are only imported when a function needs them.
+"""
+
+from .config import GRAPH_TEST_CONFIG, DetectorConfig
+from .detector import BlockResult, RsiDetector
+from .dsp import apply_bandpass_filter, butter_bandpass, calculate_envelope
+
+__all__ = [
+    "BlockResult",
+    "DetectorConfig",
+    "GRAPH_TEST_CONFIG",
+    "RsiDetector",
+    "apply_bandpass_filter",
+    "butter_bandpass",
+    "calculate_envelope",
+]
@@ -0,0 +1,31 @@
+"""Thin pyFirmata wrapper used by the command line tools."""
+
+import time
+
+
+class FirmataBoard:
+    def __init__(self, config):
+        import pyfirmata
+
+        self.config = config
+        self.board = pyfirmata.ArduinoMega(config.serial_port, baudrate=config.baud_rate)
+        self._iterator = pyfirmata.util.Iterator(self.board)
+        self._iterator.start()
+        self._emg = self.board.get_pin(f'a:{config.emg_pin}:i')
+        self._alert = self.board.get_pin(f'd:{config.alert_pin}:o')
+        self._alert.write(0.0)
+
+    def read(self):
+        """Latest EMG reading scaled to the integer range the filters were tuned on, or None."""
+        value = self._emg.read()
+        if value is None:
+            return None
+        return int(value * 1000)
+
+    def pulse_alert(self, seconds=None):
+        self._alert.write(1.0)
+        time.sleep(self.config.alert_seconds if seconds is None else seconds)
+        self._alert.write(0.0)
+
+    def close(self):
+        self.board.exit()
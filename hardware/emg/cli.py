@@ -0,0 +1,206 @@
+"""Command line entry point: ``python -m emg {detect,graph,view}``.
+
+Only argparse and the detector are imported up front; pyfirmata, requests,
+scipy and matplotlib are pulled in by the subcommand that needs them.
+"""
+
+import argparse
+import dataclasses
+import sys
+import time
+import traceback
+from collections import deque
+
+from .config import GRAPH_TEST_CONFIG, DetectorConfig
+from .detector import RsiDetector
+from .recording import SessionWriter, new_session_path
+
+
+def _connect(config):
+    from .board import FirmataBoard
+
+    try:
+        return FirmataBoard(config)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def _post_event(endpoint, payload):
+    import requests
+
+    try:
+        requests.post(endpoint, json=payload)
+    except requests.exceptions.RequestException as e:
+        print(f"Failed to send {payload['event_type']} event: {e}")
+        return False
+    return True
+
+
+def acquire(board, detector, on_block, on_sample=None, stop_event=None):
+    """Poll the board until ``stop_event`` is set (or forever), calibrating first and then feeding fixed-size blocks to the detector."""
+    cfg = detector.config
+    buffer = []
+    start_time = time.time()
+    while stop_event is None or not stop_event.is_set():
+        value = board.read()
+        time.sleep(0.001)
+        now = time.time() - start_time
+        if value is not None:
+            buffer.append(value)
+            if on_sample is not None:
+                on_sample(now, value)
+
+        if now < cfg.calibration_seconds:
+            continue
+        if not detector.calibrated:
+            print("Initialization Finished — calculating baseline stats...")
+            baseline_mean, baseline_std = detector.calibrate(buffer)
+            print(f"Baseline mean: {baseline_mean:.3f}, std: {baseline_std:.3f}")
+            buffer = []
+        elif len(buffer) >= cfg.block_size:
+            on_block(detector.process_block(buffer, now))
+            buffer = []
+
+
+def run_detect(config, post=True):
+    board = _connect(config)
+    detector = RsiDetector(config)
+
+    def on_block(result):
+        for event in result.events:
+            if event["event_type"] == "detection":
+                print(f"[DETECTION] Sustained activation detected at t = {event['time']:.2f}s (mean envelope = {event['mean_envelope']:.2f})")
+                board.pulse_alert()
+                if post and _post_event(config.api_endpoint, event):
+                    time.sleep(2)
+            else:
+                print(f"[RSI] End of risk interval (+{event['elapsed_time']:.2f}s). Total RSI risk time: {event['total_time']:.2f}s")
+                if post:
+                    _post_event(config.api_endpoint, event)
+
+    print("Calibrating....")
+    try:
+        acquire(board, detector, on_block)
+    except KeyboardInterrupt:
+        print("Stopping data collection")
+        print("[RSI] Total Risk time: " + str(detector.rsi_risk_accumulated))
+
+
+def _record(config, session_path, scope=None, stop_event=None):
+    """Record to ``session_path`` until interrupted (or ``stop_event`` is set), feeding ``scope`` if given."""
+    board = _connect(config)
+    detector = RsiDetector(config)
+    writer = SessionWriter(session_path, config)
+    recent_times = deque(maxlen=config.block_size * 2)
+
+    def on_sample(now, value):
+        recent_times.append(now)
+        writer.append(now, value)
+
+    def on_block(result):
+        block_times = list(recent_times)[-len(result.samples):]
+        if scope is not None:
+            scope.push(result, block_times)
+        for event in result.events:
+            if event["event_type"] == "detection":
+                print(f"[DETECTION] Sustained activation detected at t = {event['time']:.2f}s (mean envelope = {event['mean_envelope']:.2f})")
+                board.pulse_alert()
+        # Check and print detected peaks
+        if result.peaks.size > 0 and scope is None:
+            print(f"Detected peaks at: {[round(block_times[p], 3) for p in result.peaks]}")
+
+    print(f"Start (recording to {session_path})")
+    try:
+        acquire(board, detector, on_block, on_sample, stop_event)
+    finally:
+        writer.close()
+
+
+def _record_live(config, session_path, scope, stop_event):
+    # Child process of ``graph --live``: rendering in the parent cannot hold the GIL against sampling here
+    try:
+        _record(config, session_path, scope, stop_event)
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        print("Error: data collection stopped unexpectedly")
+        traceback.print_exc()
+    finally:
+        # Also closes the scope window if the board goes away
+        stop_event.set()
+
+
+def run_graph(config, record_dir="recordings", show=True, live=False):
+    session_path = new_session_path(record_dir)
+    try:
+        if not live:
+            _record(config, session_path)
+        else:
+            import multiprocessing
+
+            from .scope import LiveScope
+
+            # Sampling gets its own process; the scope only reads the shared ring buffers
+            scope = LiveScope(config)
+            stop = multiprocessing.Event()
+            worker = multiprocessing.Process(target=_record_live, args=(config, session_path, scope, stop), daemon=True)
+            worker.start()
+            try:
+                scope.run(stop)
+            finally:
+                stop.set()
+                worker.join()
+    except KeyboardInterrupt:
+        print("Stopping data collection and plotting results.")
+    if show and not live:
+        run_view(session_path)
+
+
+def run_view(path):
+    from .viewer import view_session
+
+    view_session(path)
+
+
+def _board_args(parser):
+    parser.add_argument("--port", help="Serial port of the Arduino (default: /dev/cu.usbmodem1201)")
+    parser.add_argument("--baud", type=int, help="Serial baud rate")
+
+
+def _with_overrides(config, args):
+    overrides = {}
+    if args.port:
+        overrides["serial_port"] = args.port
+    if args.baud:
+        overrides["baud_rate"] = args.baud
+    if getattr(args, "api", None):
+        overrides["api_endpoint"] = args.api
+    return dataclasses.replace(config, **overrides)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m emg", description="EMG wrist strain tools for the BioAmp EXG Pill.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    detect = sub.add_parser("detect", help="Run RSI detection and post telemetry to the hardware API")
+    _board_args(detect)
+    detect.add_argument("--api", help="POST /rsi endpoint (default: http://localhost:8000/rsi)")
+    detect.add_argument("--no-api", action="store_true", help="Only print detections, do not post them")
+
+    graph = sub.add_parser("graph", help="Record a bench session and plot it after Ctrl-C")
+    _board_args(graph)
+    graph.add_argument("--record-dir", default="recordings", help="Where sessions are saved (default: %(default)s)")
+    graph.add_argument("--no-plot", action="store_true", help="Only record, do not open the viewer afterwards")
+    graph.add_argument("--live", action="store_true", help="Show a live scrolling scope while recording")
+
+    view = sub.add_parser("view", help="Browse a recorded session (decimated, fast on multi-hour recordings)")
+    view.add_argument("session", help="Session directory written by the graph command")
+
+    args = parser.parse_args(argv)
+    if args.command == "detect":
+        run_detect(_with_overrides(DetectorConfig(), args), post=not args.no_api)
+    elif args.command == "graph":
+        run_graph(_with_overrides(GRAPH_TEST_CONFIG, args), record_dir=args.record_dir, show=not args.no_plot, live=args.live)
+    elif args.command == "view":
+        run_view(args.session)
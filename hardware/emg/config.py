@@ -0,0 +1,60 @@
+"""Tuning parameters for the EMG pipeline (formerly module constants in RSIDetection.py)."""
+
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class DetectorConfig:
+    # Board connection
+    serial_port: str = '/dev/cu.usbmodem1201'  # Replace with your Arduino's port
+    baud_rate: int = 9600  # Match the Arduino's serial rate
+    emg_pin: int = 0  # Analog input the EXG Pill is wired to
+    alert_pin: int = 13  # Motion Vibrato / LED output
+
+    # Band-pass filter parameters
+    low_cutoff: float = 74.5  # Low cutoff frequency in Hz
+    high_cutoff: float = 149.5  # High cutoff frequency in Hz
+    sampling_rate: int = 500  # Sampling rate in Hz (update to your actual rate)
+
+    # Envelope filter parameters
+    envelope_cutoff: float = 10  # Low-pass filter cutoff for envelope extraction (in Hz)
+    envelope_prominence: float = 0.3  # Prominence for the envelope peak detection
+    envelope_height: float = 5
+    envelope_width: float = 0.0025
+
+    # Activation detection
+    calibration_seconds: float = 12  # Initial resting period used for the baseline
+    block_seconds: float = 0.2  # Samples are processed in blocks of this length
+    threshold_std_multiplier: float = 1.5  # can be tuned
+    baseline_alpha: float = 0.001  # Slow adaptation of the baseline (0 disables it)
+    sustain_duration: float = 2
+    break_tolerance: float = 1
+    alert_seconds: float = 2  # How long the alert pin stays high on detection
+
+    # Typing detection tuning
+    typing_min_freq: float = 0.5  # Minimum repetition rate (Hz)
+    typing_max_freq: float = 10.0  # Maximum repetition rate (Hz)
+    activity_window: float = 2.0  # Seconds of envelope history to analyze frequency
+    peak_prominence: float = 0.3  # How strong envelope peaks must be
+
+    # Telemetry
+    api_endpoint: str = "http://localhost:8000/rsi"
+    vibrate_endpoint: str = field(default_factory=lambda: os.environ.get("VIBRATE_ENDPOINT", "http://localhost:8000/vibrate"))
+    vibrate_timeout_seconds: float = field(default_factory=lambda: float(os.environ.get("VIBRATE_TIMEOUT", 5)))
+
+    @property
+    def block_size(self):
+        return int(self.sampling_rate * self.block_seconds)
+
+
+# Settings GraphTest.py has always used for bench testing electrodes
+GRAPH_TEST_CONFIG = DetectorConfig(
+    envelope_cutoff=7,
+    envelope_prominence=0.01,
+    envelope_height=5,  # Height is the thing to adjust in order to get the right peaks Misbah = 2.2. Fawwaz = 5
+    block_seconds=0.1,
+    threshold_std_multiplier=2.0,
+    baseline_alpha=0.0,
+    sustain_duration=30,
+)
@@ -0,0 +1,152 @@
+"""Sustained-activation / RSI risk detection on blocks of raw EMG samples."""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .config import DetectorConfig
+from .dsp import apply_bandpass_filter, calculate_envelope, find_envelope_peaks
+
+
+@dataclass
+class BlockResult:
+    time: float
+    samples: np.ndarray
+    filtered: np.ndarray
+    envelope: np.ndarray
+    mean_envelope: float
+    threshold: float
+    peaks: np.ndarray  # Indices into ``envelope`` of the detected envelope peaks
+    is_typing_like: bool
+    # Telemetry payloads in the shape POST /rsi expects ("detection" / "rsi_interval")
+    events: list = field(default_factory=list)
+
+
+class RsiDetector:
+    """Stateful detector fed one block of samples at a time.
+
+    Call ``calibrate()`` with the resting samples first, then ``process_block()``
+    for every subsequent block. The detector never touches the board or the
+    network; callers act on the ``events`` of each ``BlockResult``.
+    """
+
+    def __init__(self, config: Optional[DetectorConfig] = None):
+        self.config = config or DetectorConfig()
+        self.baseline_mean = None
+        self.baseline_std = None
+        self.rsi_risk_accumulated = 0.0
+        self._rsi_risk_start_time = None
+        self._activation_start_time = None
+        self._activation_triggered = False
+        self._last_active_time = None
+        # (block time, envelope) pairs covering the last ``activity_window`` seconds
+        self._envelope_history = deque()
+
+    @property
+    def calibrated(self):
+        return self.baseline_mean is not None and self.baseline_std is not None
+
+    def filter(self, samples):
+        cfg = self.config
+        filtered = apply_bandpass_filter(np.asarray(samples, dtype=float), cfg.low_cutoff, cfg.high_cutoff, cfg.sampling_rate)
+        envelope = calculate_envelope(filtered, cfg.sampling_rate, cfg.envelope_cutoff)
+        return filtered, envelope
+
+    def calibrate(self, samples):
+        _, envelope = self.filter(samples)
+        self.baseline_mean = float(np.mean(envelope))
+        self.baseline_std = float(np.std(envelope))
+        return self.baseline_mean, self.baseline_std
+
+    def process_block(self, samples, current_time) -> BlockResult:
+        cfg = self.config
+        samples = np.asarray(samples, dtype=float)
+        filtered, envelope = self.filter(samples)
+        mean_env = float(np.mean(envelope))
+        peaks = find_envelope_peaks(envelope, prominence=cfg.envelope_prominence, width=cfg.envelope_width, height=cfg.envelope_height)
+
+        # Maintain rolling envelope history for rhythm analysis
+        history = self._envelope_history
+        history.append((current_time, envelope))
+        # Keep only the last activity_window seconds
+        while history and (current_time - history[0][0]) > cfg.activity_window:
+            history.popleft()
+
+        # Update threshold dynamically if baseline exists
+        if self.calibrated:
+            # Slow adaptation to long-term changes
+            alpha = cfg.baseline_alpha
+            if alpha:
+                self.baseline_mean = (1 - alpha) * self.baseline_mean + alpha * mean_env
+                self.baseline_std = (1 - alpha) * self.baseline_std + alpha * float(np.std(envelope))
+            adaptive_threshold = self.baseline_mean + cfg.threshold_std_multiplier * self.baseline_std
+        else:
+            adaptive_threshold = 0.0  # Safe fallback until baseline computed
+
+        result = BlockResult(
+            time=current_time,
+            samples=samples,
+            filtered=filtered,
+            envelope=envelope,
+            mean_envelope=mean_env,
+            threshold=adaptive_threshold,
+            peaks=peaks,
+            is_typing_like=self._is_typing_like(),
+        )
+        self._update_activation(result)
+        return result
+
+    def _is_typing_like(self):
+        # Analyze rhythmicity of recent envelope segment
+        cfg = self.config
+        history = self._envelope_history
+        if sum(len(env) for _, env in history) <= 5:
+            return False
+        env_segment = np.concatenate([env for _, env in history])
+        num_peaks = len(find_envelope_peaks(env_segment, prominence=cfg.peak_prominence))
+
+        # Estimate repetition rate (Hz)
+        duration = history[-1][0] - history[0][0]
+        repetition_rate = num_peaks / max(duration, 1e-6)
+        return cfg.typing_min_freq <= repetition_rate <= cfg.typing_max_freq
+
+    def _update_activation(self, result):
+        # Grace period–based sustained activation detection + RSI tracking
+        cfg = self.config
+        current_time = result.time
+        if result.mean_envelope > result.threshold:  # Currently active above threshold
+            if self._activation_start_time is None:
+                self._activation_start_time = current_time  # Start new activation
+            self._last_active_time = current_time  # Update last time we were above threshold
+
+            if self._rsi_risk_start_time is None:
+                self._rsi_risk_start_time = current_time  # Begin a new RSI risk interval
+
+            if (current_time - self._activation_start_time) >= cfg.sustain_duration and not self._activation_triggered:
+                self._activation_triggered = True
+                self._activation_start_time = None
+                result.events.append({
+                    "event_type": "detection",
+                    "time": current_time,
+                    "mean_envelope": result.mean_envelope,
+                })
+        elif self._last_active_time is not None and (current_time - self._last_active_time) <= cfg.break_tolerance:
+            # Below threshold but within grace period, allow short dropouts
+            pass
+        else:
+            # Too long below threshold — reset sustained detection
+            self._activation_start_time = None
+            self._activation_triggered = False
+
+            # If previously in RSI risk state, accumulate elapsed time
+            if self._rsi_risk_start_time is not None:
+                elapsed_risk_time = current_time - self._rsi_risk_start_time
+                self.rsi_risk_accumulated += elapsed_risk_time
+                result.events.append({
+                    "event_type": "rsi_interval",
+                    "elapsed_time": elapsed_risk_time,
+                    "total_time": self.rsi_risk_accumulated,
+                })
+                self._rsi_risk_start_time = None
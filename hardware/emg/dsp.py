@@ -0,0 +1,53 @@
+"""Filtering helpers shared by the detector, the recorders and the viewers.
+
+scipy is imported on first use so that ``import emg`` stays cheap.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+# Band-pass filter design and application
+@lru_cache(maxsize=16)
+def butter_bandpass(lowcut, highcut, fs, order=4):
+    from scipy.signal import butter
+
+    nyquist = 0.5 * fs
+    low = lowcut / nyquist
+    high = highcut / nyquist
+    b, a = butter(order, [low, high], btype='band')
+    return b, a
+
+
+@lru_cache(maxsize=16)
+def butter_lowpass(cutoff_freq, fs, order=4):
+    from scipy.signal import butter
+
+    nyquist_freq = fs / 2.0
+    normalized_cutoff = cutoff_freq / nyquist_freq
+    b, a = butter(order, normalized_cutoff, btype='low')
+    return b, a
+
+
+def apply_bandpass_filter(data, lowcut, highcut, fs, order=4):
+    from scipy.signal import filtfilt
+
+    b, a = butter_bandpass(lowcut, highcut, fs, order)
+    return filtfilt(b, a, data)
+
+
+# Function to calculate the envelope of the EMG signal
+def calculate_envelope(emg_signal, sampling_rate, cutoff_freq=5.0):
+    from scipy.signal import filtfilt
+
+    rectified_signal = np.abs(emg_signal)
+    b, a = butter_lowpass(cutoff_freq, sampling_rate)
+    return filtfilt(b, a, rectified_signal)
+
+
+def find_envelope_peaks(envelope, **kwargs):
+    from scipy.signal import find_peaks
+
+    peaks, _ = find_peaks(envelope, **kwargs)
+    return peaks
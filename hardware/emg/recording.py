@@ -0,0 +1,274 @@
+"""On-disk EMG sessions and the min/max decimation pyramid used by the viewer.
+
+A session is a directory holding flat little-endian arrays that grow while
+recording and are memory-mapped when read back::
+
+    session/
+        meta.json         sampling rate + the DetectorConfig used to record
+        times.f64         seconds since start, one per sample
+        raw.f32           raw readings
+        filtered.f32      band-passed signal   (derived, cached on first open)
+        envelope.f32      envelope             (derived, cached on first open)
+        peaks.i64         envelope peak indices (derived, cached on first open)
+        pyramid/          <channel>_<level>.npy min/max bins (derived, cached)
+
+Derived files are rebuilt whenever the sample count or the filter settings
+stored next to them no longer match.
+"""
+
+import dataclasses
+import json
+import os
+import time
+
+import numpy as np
+
+from .config import DetectorConfig
+from .dsp import apply_bandpass_filter, calculate_envelope, find_envelope_peaks
+
+# Samples per bin at the finest pyramid level, and the reduction between levels
+PYRAMID_BASE = 64
+PYRAMID_FACTOR = 4
+# Stop adding levels once a level is this small; it already fits any screen
+PYRAMID_MIN_BINS = 2048
+# Number of level-0 bins reduced per step so building never loads a whole channel
+PYRAMID_CHUNK_BINS = 1 << 16
+
+
+class SessionWriter:
+    """Appends samples to a new session directory, flushing every ``flush_every`` samples.
+
+    Raises ``FileExistsError`` if ``path`` already exists so an earlier session is never appended to.
+    """
+
+    def __init__(self, path, config, flush_every=500):
+        self.path = path
+        self.config = config
+        self.flush_every = flush_every
+        self._times = []
+        self._values = []
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        os.mkdir(path)
+        self._times_file = open(os.path.join(path, "times.f64"), "xb")
+        self._raw_file = open(os.path.join(path, "raw.f32"), "xb")
+        _write_json(os.path.join(path, "meta.json"), {"created": time.time(), "sampling_rate": config.sampling_rate, "config": dataclasses.asdict(config)})
+
+    def append(self, t, value):
+        self._times.append(t)
+        self._values.append(value)
+        if len(self._times) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self._times:
+            return
+        np.asarray(self._times, dtype="<f8").tofile(self._times_file)
+        np.asarray(self._values, dtype="<f4").tofile(self._raw_file)
+        self._times_file.flush()
+        self._raw_file.flush()
+        self._times = []
+        self._values = []
+
+    def close(self):
+        self.flush()
+        self._times_file.close()
+        self._raw_file.close()
+
+
+def new_session_path(root):
+    """Unused ``session-<timestamp>`` directory under ``root``; a numeric suffix separates runs started in the same second."""
+    base = os.path.join(root, time.strftime("session-%Y%m%d-%H%M%S"))
+    path = base
+    suffix = 2
+    while os.path.exists(path):
+        path = f"{base}-{suffix}"
+        suffix += 1
+    return path
+
+
+class Session:
+    """Read-only view of a recorded session; arrays are memory-mapped, derived data is cached."""
+
+    def __init__(self, path):
+        self.path = path
+        meta = _read_json(os.path.join(path, "meta.json"))
+        if meta is None:
+            raise FileNotFoundError(f"{path} is not a recorded EMG session (missing meta.json)")
+        known = {f.name for f in dataclasses.fields(DetectorConfig)}
+        self.config = DetectorConfig(**{k: v for k, v in meta.get("config", {}).items() if k in known})
+        self.times = _open_array(os.path.join(path, "times.f64"), "<f8")
+        raw = _open_array(os.path.join(path, "raw.f32"), "<f4")
+        # A recording interrupted mid-flush can leave the two files one write apart
+        self.size = min(len(self.times), len(raw))
+        self.times = self.times[:self.size]
+        self._channels = {"raw": raw[:self.size]}
+        self._pyramids = {}
+        self._peaks = None
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def duration(self):
+        return float(self.times[-1] - self.times[0]) if self.size else 0.0
+
+    def channel(self, name):
+        if name not in self._channels:
+            self._build_derived()
+        return self._channels[name]
+
+    def peaks(self):
+        if self._peaks is None:
+            self._build_derived()
+        return self._peaks
+
+    def _derived_key(self):
+        cfg = self.config
+        return {
+            "size": self.size,
+            "filter": [cfg.low_cutoff, cfg.high_cutoff, cfg.sampling_rate, cfg.envelope_cutoff],
+            "peaks": [cfg.envelope_prominence, cfg.envelope_height, cfg.envelope_width],
+            "pyramid": [PYRAMID_BASE, PYRAMID_FACTOR],
+        }
+
+    def _build_derived(self):
+        key_path = os.path.join(self.path, "derived.json")
+        key = self._derived_key()
+        paths = {name: os.path.join(self.path, f"{name}.f32") for name in ("filtered", "envelope")}
+        peaks_path = os.path.join(self.path, "peaks.i64")
+        if _read_json(key_path) != key or not all(os.path.exists(p) for p in [*paths.values(), peaks_path]):
+            cfg = self.config
+            print(f"Filtering {self.size} samples (cached in {self.path})...")
+            raw = np.asarray(self._channels["raw"], dtype=float)
+            filtered = apply_bandpass_filter(raw, cfg.low_cutoff, cfg.high_cutoff, cfg.sampling_rate)
+            envelope = calculate_envelope(filtered, cfg.sampling_rate, cfg.envelope_cutoff)
+            peaks = find_envelope_peaks(envelope, prominence=cfg.envelope_prominence, height=cfg.envelope_height, width=cfg.envelope_width)
+            filtered.astype("<f4").tofile(paths["filtered"])
+            envelope.astype("<f4").tofile(paths["envelope"])
+            peaks.astype("<i8").tofile(peaks_path)
+            del raw, filtered, envelope
+            _write_json(key_path, key)
+            _clear_pyramid(os.path.join(self.path, "pyramid"))
+        for name, path in paths.items():
+            self._channels[name] = _open_array(path, "<f4")
+        self._peaks = np.fromfile(peaks_path, dtype="<i8")
+
+    def pyramid(self, name):
+        """Min/max levels for ``name``; level ``k`` has bins of ``PYRAMID_BASE * PYRAMID_FACTOR**k`` samples."""
+        if name not in self._pyramids:
+            data = self.channel(name)
+            root = os.path.join(self.path, "pyramid")
+            levels = _load_pyramid(root, name, len(data))
+            if levels is None:
+                levels = _build_pyramid(data)
+                _save_pyramid(root, name, len(data), levels)
+                levels = _load_pyramid(root, name, len(data))
+            self._pyramids[name] = levels
+        return self._pyramids[name]
+
+    def index_range(self, t0, t1):
+        i0 = int(np.searchsorted(self.times, t0, side="left"))
+        i1 = int(np.searchsorted(self.times, t1, side="right"))
+        return max(i0 - 1, 0), min(i1 + 1, self.size)
+
+    def window(self, name, t0, t1, pixels):
+        """Return ``(x, y)`` covering ``[t0, t1]`` with at most ~2 points per pixel.
+
+        When the range holds more samples than pixels, each pixel column becomes a
+        min/max pair so spikes stay visible at every zoom level.
+        """
+        i0, i1 = self.index_range(t0, t1)
+        data = self.channel(name)
+        span = i1 - i0
+        pixels = max(int(pixels), 1)
+        if span <= 2 * pixels:
+            return np.asarray(self.times[i0:i1]), np.asarray(data[i0:i1])
+
+        samples_per_pixel = span / pixels
+        level = -1
+        for k in range(len(self.pyramid(name))):
+            if PYRAMID_BASE * PYRAMID_FACTOR ** k <= samples_per_pixel:
+                level = k
+        if level < 0:
+            # Zoomed in below the finest level: reduce the raw samples directly
+            bin_size = 1
+            mins = maxs = np.asarray(data[i0:i1])
+            first = i0
+        else:
+            bin_size = PYRAMID_BASE * PYRAMID_FACTOR ** level
+            b0, b1 = i0 // bin_size, -(-i1 // bin_size)
+            bins = np.asarray(self.pyramid(name)[level][b0:b1])
+            mins, maxs = bins[:, 0], bins[:, 1]
+            first = b0 * bin_size
+
+        edges = np.unique(np.linspace(0, len(mins), pixels + 1).astype(np.intp)[:-1])
+        mins = np.minimum.reduceat(mins, edges)
+        maxs = np.maximum.reduceat(maxs, edges)
+        x = np.asarray(self.times[np.minimum(first + edges * bin_size, self.size - 1)])
+        return np.repeat(x, 2), np.column_stack((mins, maxs)).ravel()
+
+
+def _build_pyramid(data):
+    levels = []
+    n_bins = -(-len(data) // PYRAMID_BASE)
+    level0 = np.empty((n_bins, 2), dtype=np.float32)
+    step = PYRAMID_CHUNK_BINS * PYRAMID_BASE
+    for start in range(0, len(data), step):
+        chunk = np.asarray(data[start:start + step])
+        out = level0[start // PYRAMID_BASE:start // PYRAMID_BASE + -(-len(chunk) // PYRAMID_BASE)]
+        out[:] = _reduce_pairs(chunk, chunk, PYRAMID_BASE)
+    levels.append(level0)
+    while len(levels[-1]) > PYRAMID_MIN_BINS:
+        prev = levels[-1]
+        levels.append(_reduce_pairs(prev[:, 0], prev[:, 1], PYRAMID_FACTOR))
+    return levels
+
+
+def _reduce_pairs(mins, maxs, size):
+    edges = np.arange(0, len(mins), size)
+    return np.column_stack((np.minimum.reduceat(mins, edges), np.maximum.reduceat(maxs, edges))).astype(np.float32)
+
+
+def _save_pyramid(root, name, size, levels):
+    os.makedirs(root, exist_ok=True)
+    for k, level in enumerate(levels):
+        np.save(os.path.join(root, f"{name}_{k}.npy"), level)
+    _write_json(os.path.join(root, f"{name}.json"), {"size": size, "levels": len(levels), "base": PYRAMID_BASE, "factor": PYRAMID_FACTOR})
+
+
+def _load_pyramid(root, name, size):
+    info = _read_json(os.path.join(root, f"{name}.json"))
+    if not info or (info.get("size"), info.get("base"), info.get("factor")) != (size, PYRAMID_BASE, PYRAMID_FACTOR):
+        return None
+    try:
+        return [np.load(os.path.join(root, f"{name}_{k}.npy"), mmap_mode="r") for k in range(info["levels"])]
+    except (OSError, ValueError):
+        return None
+
+
+def _clear_pyramid(root):
+    if not os.path.isdir(root):
+        return
+    for entry in os.listdir(root):
+        os.remove(os.path.join(root, entry))
+
+
+def _open_array(path, dtype):
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
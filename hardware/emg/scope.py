@@ -0,0 +1,240 @@
+"""Live oscilloscope for tuning electrodes: ``python -m emg graph --live``.
+
+Acquisition runs in a child process and only appends to ring buffers kept
+in shared memory; the matplotlib timer in the main process copies the latest
+window out and redraws the traces with blitting at a fixed frame rate.
+Agg holds the GIL while it rasterises a frame, so a render thread would stall
+a sampling thread in the same process; separate processes only compete for
+CPU time. The achieved sampling rate is shown next to the render time.
+"""
+
+import multiprocessing
+import time
+from collections import deque
+
+import numpy as np
+
+# Channels kept per sample in the scope's ring buffer
+TRACE_CHANNELS = ("time", "raw", "filtered", "envelope", "threshold")
+# Latest detector state and achieved sampling rate, written once per block
+STATUS_CHANNELS = ("threshold", "mean_envelope", "sample_rate")
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of ``len(channels)`` parallel float series in shared memory.
+
+    Safe to use from several threads, and from a child process when passed as a
+    ``multiprocessing.Process`` argument.
+    """
+
+    def __init__(self, capacity, channels):
+        self.capacity = int(capacity)
+        self.channels = tuple(channels)
+        self._shared = multiprocessing.RawArray("d", len(self.channels) * self.capacity)
+        self._count = multiprocessing.RawValue("q", 0)
+        self._lock = multiprocessing.Lock()
+        self._attach()
+
+    def _attach(self):
+        self._data = np.frombuffer(self._shared, dtype=float).reshape(len(self.channels), self.capacity)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_data"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._attach()
+
+    @property
+    def _written(self):
+        return self._count.value
+
+    def __len__(self):
+        return min(self._written, self.capacity)
+
+    def extend(self, block):
+        """Append ``block`` shaped ``(channels, n)``; only the last ``capacity`` columns are kept."""
+        block = np.asarray(block, dtype=float)
+        n = block.shape[1]
+        if n > self.capacity:
+            block = block[:, -self.capacity:]
+            n = self.capacity
+        with self._lock:
+            start = self._written % self.capacity
+            first = min(n, self.capacity - start)
+            self._data[:, start:start + first] = block[:, :first]
+            self._data[:, :n - first] = block[:, first:]
+            self._count.value += n
+
+    def latest(self, n=None):
+        """Copy of the newest ``n`` columns (all by default) in chronological order."""
+        with self._lock:
+            size = min(self._written, self.capacity)
+            n = size if n is None else min(int(n), size)
+            end = self._written % self.capacity
+            idx = np.arange(end - n, end) % self.capacity
+            return self._data[:, idx]
+
+
+def minmax_decimate(x, ys, pixels):
+    """Reduce rows of ``ys`` to per-pixel-column ``(x, mins, maxs)``; short inputs come back with ``mins is maxs``."""
+    n = len(x)
+    if pixels <= 0 or n <= 2 * pixels:
+        return x, ys, ys
+    edges = np.unique(np.linspace(0, n, pixels + 1).astype(np.intp)[:-1])
+    return x[edges], np.minimum.reduceat(ys, edges, axis=1), np.maximum.reduceat(ys, edges, axis=1)
+
+
+class LiveScope:
+    """Scrolling raw / filtered / envelope view fed from an ``RsiDetector`` block stream."""
+
+    def __init__(self, config, window_seconds=10.0, fps=30):
+        self.config = config
+        self.window_seconds = window_seconds
+        self.fps = fps
+        self.traces = RingBuffer(window_seconds * config.sampling_rate * 2, TRACE_CHANNELS)
+        self.peaks = RingBuffer(1024, ("time", "envelope"))
+        self.status = RingBuffer(1, STATUS_CHANNELS)
+        self.render_times = deque(maxlen=max(int(fps), 1) * 5)
+        self._frames = 0
+        self._render_total = 0.0
+        self._last_pushed = None
+
+    def push(self, result, times):
+        """Record one ``BlockResult``; ``times`` are the sample times of ``result.samples``. Called from the acquisition process."""
+        times = np.asarray(times, dtype=float)
+        threshold = np.full(len(times), result.threshold)
+        self.traces.extend([times, result.samples, result.filtered, result.envelope, threshold])
+        if result.peaks.size:
+            self.peaks.extend([times[result.peaks], result.envelope[result.peaks]])
+        # Samples per second since the previous block, including the time spent in the detector
+        first = times[0] if self._last_pushed is None else self._last_pushed
+        span = times[-1] - first
+        count = len(times) - 1 if self._last_pushed is None else len(times)
+        self._last_pushed = times[-1]
+        self.status.extend([[result.threshold], [result.mean_envelope], [count / span if span > 0 else np.nan]])
+
+    def run(self, stop_event=None):
+        """Show the scope until the window is closed (blocks; call from the main thread)."""
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Polygon
+
+        fig, axes = plt.subplots(3, 1, figsize=(10, 8), sharex=True)
+        self._fig, self._axes = fig, axes
+        # Dense raw/filtered traces are drawn as a min/max band per pixel column:
+        # filling one polygon is several times cheaper for Agg than stroking a zigzag line.
+        self._bands = {}
+        for ax, name, color, label in ((axes[0], "raw", "blue", "Raw Data"), (axes[1], "filtered", "green", "Filtered Data")):
+            band = Polygon(np.zeros((1, 2)), closed=True, facecolor=color, edgecolor=color, linewidth=0.8, label=label, animated=True)
+            ax.add_patch(band)
+            self._bands[name] = band
+        self._lines = {
+            "envelope": axes[2].plot([], [], color="purple", label="Envelope", animated=True)[0],
+            "threshold": axes[2].plot([], [], "--", color="orange", label="Adaptive Threshold", animated=True)[0],
+            "peaks": axes[2].plot([], [], "x", color="red", label="Peaks", animated=True)[0],
+        }
+        for ax, title in zip(axes, ("Raw EMG Signal", "Band-Pass Filtered Signal", "Envelope with Detected Peaks")):
+            ax.set_title(title)
+            ax.set_ylabel("Amplitude")
+            ax.set_xlim(-self.window_seconds, 0)
+            ax.legend(loc="upper left")
+        axes[2].set_xlabel("Time relative to now (s)")
+        self._artists = [*self._bands.values(), *self._lines.values()]
+        self._background = None
+        self._last_status = 0.0
+        fig.tight_layout()
+
+        fig.canvas.mpl_connect("draw_event", self._on_draw)
+        timer = fig.canvas.new_timer(interval=int(1000 / self.fps))
+        timer.add_callback(self._frame, stop_event)
+        timer.start()
+        plt.show()
+        timer.stop()
+        if self._frames:
+            print(f"Live scope: {self._frames} frames, average render {1000 * self._render_total / self._frames:.2f} ms/frame, {self._sampling()}")
+
+    def _on_draw(self, event):
+        # A full redraw (first show, resize, y-rescale) invalidates the cached background
+        self._background = self._fig.canvas.copy_from_bbox(self._fig.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self._artists:
+            artist.axes.draw_artist(artist)
+
+    def _frame(self, stop_event):
+        canvas = self._fig.canvas
+        if stop_event is not None and stop_event.is_set():
+            import matplotlib.pyplot as plt
+
+            plt.close(self._fig)
+            return
+        if self._background is None:
+            return
+        start = time.perf_counter()
+
+        traces = self.traces.latest()
+        now = traces[0, -1] if traces.shape[1] else 0.0
+        visible = traces[:, traces[0] >= now - self.window_seconds]
+        x, mins, maxs = minmax_decimate(visible[0] - now, visible[1:], int(self._axes[0].bbox.width))
+        for row, name in enumerate(("raw", "filtered")):
+            self._bands[name].set_xy(np.column_stack((np.r_[x, x[::-1]], np.r_[maxs[row], mins[row][::-1]])))
+        self._lines["envelope"].set_data(np.repeat(x, 2), np.column_stack((mins[2], maxs[2])).ravel())
+        self._lines["threshold"].set_data(x, maxs[3])
+        peaks = self.peaks.latest()
+        recent = peaks[0] >= now - self.window_seconds
+        self._lines["peaks"].set_data(peaks[0, recent] - now, peaks[1, recent])
+
+        rescale = False
+        if visible.shape[1]:
+            for ax, rows in zip(self._axes, ((0,), (1,), (2, 3))):
+                rescale |= self._fit_ylim(ax, mins[list(rows)], maxs[list(rows)])
+        if rescale:
+            # Axis limits changed: redraw everything now (refreshing the background via
+            # _on_draw) so the full draw is counted in this frame's render time
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            self._draw_artists()
+            canvas.blit(self._fig.bbox)
+        elapsed = time.perf_counter() - start
+        self.render_times.append(elapsed)
+        self._frames += 1
+        self._render_total += elapsed
+        self._report_status(start)
+
+    def _report_status(self, now):
+        # Text is expensive to rasterise every frame, so stats go to the window title once a second
+        if now - self._last_status < 1.0:
+            return
+        self._last_status = now
+        avg = 1000 * sum(self.render_times) / len(self.render_times)
+        if len(self.status):
+            threshold, mean_envelope, _ = self.status.latest()[:, -1]
+            detector = f"threshold {threshold:.2f}  mean envelope {mean_envelope:.2f}"
+        else:
+            detector = "Calibrating..."
+        status = f"{detector} | {self._sampling()} | render {avg:.2f} ms/frame @ {self.fps} fps"
+        manager = self._fig.canvas.manager
+        if manager is not None:
+            manager.set_window_title(status)
+
+    def _sampling(self):
+        if not len(self.status):
+            return "sampling -- Hz"
+        return f"sampling {self.status.latest()[2, -1]:.0f} Hz"
+
+    @staticmethod
+    def _fit_ylim(ax, mins, maxs):
+        """Grow (or shrink when far too loose) the y range; returns True if it changed."""
+        low, high = float(mins.min()), float(maxs.max())
+        cur_low, cur_high = ax.get_ylim()
+        span = max(high - low, 1e-6)
+        too_tight = low < cur_low or high > cur_high
+        too_loose = (cur_high - cur_low) > 4 * span
+        if not (too_tight or too_loose):
+            return False
+        ax.set_ylim(low - 0.1 * span, high + 0.1 * span)
+        return True
@@ -0,0 +1,78 @@
+"""Interactive viewer for recorded sessions that stays responsive on multi-hour recordings.
+
+Only the visible time range is drawn: every pan/zoom asks the session's
+min/max pyramid for about two points per pixel column instead of handing
+matplotlib every sample.
+"""
+
+import numpy as np
+
+from .recording import Session
+
+# Peaks are only drawn once the visible range holds fewer than this many
+MAX_VISIBLE_PEAKS = 5000
+
+
+def view_session(path):
+    import matplotlib.pyplot as plt
+
+    session = path if isinstance(path, Session) else Session(path)
+    if not len(session):
+        print(f"{session.path} contains no samples")
+        return
+
+    fig, axes = plt.subplots(3, 1, figsize=(10, 8), sharex=True)
+    panels = [
+        ("raw", "Raw Data", "blue", "Raw EMG Signal"),
+        ("filtered", "Filtered Data", "green", "Band-Pass Filtered Signal"),
+        ("envelope", "Envelope", "purple", "Envelope with Detected Peaks"),
+    ]
+    lines = {}
+    for ax, (name, label, color, title) in zip(axes, panels):
+        (lines[name],) = ax.plot([], [], label=label, color=color, linewidth=0.8)
+        ax.set_ylabel("Amplitude")
+        ax.set_title(title)
+    (peak_line,) = axes[2].plot([], [], "x", color="red", label="Peaks")
+    axes[2].set_xlabel("Time (s)")
+    for ax in axes:
+        ax.legend(loc="upper right")
+
+    peaks = session.peaks()
+    envelope = session.channel("envelope")
+    t_start, t_end = float(session.times[0]), float(session.times[-1])
+
+    def render(t0, t1):
+        pixels = axes[0].bbox.width
+        for ax, (name, *_) in zip(axes, panels):
+            x, y = session.window(name, t0, t1, pixels)
+            lines[name].set_data(x, y)
+            if len(y):
+                low, high = float(np.min(y)), float(np.max(y))
+                pad = (high - low) * 0.05 or 1.0
+                ax.set_ylim(low - pad, high + pad)
+        i0, i1 = session.index_range(t0, t1)
+        visible = peaks[(peaks >= i0) & (peaks < i1)]
+        if len(visible) > MAX_VISIBLE_PEAKS:
+            visible = visible[:0]
+        peak_line.set_data(np.asarray(session.times[visible]), np.asarray(envelope[visible]))
+
+    state = {"range": None}
+
+    def on_xlim_changed(ax):
+        t0, t1 = ax.get_xlim()
+        if state["range"] == (t0, t1):
+            return
+        state["range"] = (t0, t1)
+        render(max(t0, t_start), min(t1, t_end))
+        fig.canvas.draw_idle()
+
+    def on_resize(event):
+        state["range"] = None
+        on_xlim_changed(axes[0])
+
+    axes[0].set_xlim(t_start, t_end if t_end > t_start else t_start + 1)
+    axes[0].callbacks.connect("xlim_changed", on_xlim_changed)
+    fig.canvas.mpl_connect("resize_event", on_resize)
+    fig.tight_layout()
+    on_xlim_changed(axes[0])
+    plt.show()